@@ -1,8 +1,19 @@
 import ast
-import itertools
+import collections
+import copy
+import functools
+import math
+import os
+import sys
 import yaml
 import numpy as np
 
+# Use the libyaml based loader when PyYAML was built with it.
+try:
+    from yaml import CSafeLoader
+except ImportError:
+    from yaml import SafeLoader as CSafeLoader
+
 # Try to import particle_accelerator_utilities for calculation of relativistic 
 # quantities.
 try:
@@ -10,6 +21,97 @@ try:
 except ImportError:
     pass
 
+# Try to import numba for compiling formulas that only use elementwise arithmetic.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# modules formulas can use besides the variables in settings
+_EVAL_GLOBALS = {'np': np, 'math': math}
+if 'pau' in globals():
+    _EVAL_GLOBALS['pau'] = pau
+
+# nested key sets of the 'input' and 'output' settings
+_KS_EMPTY = frozenset()
+_KS_VALUE = frozenset(['value'])
+_KS_LINSPACE = frozenset(['min','max','number_steps'])
+_KS_ARANGE = frozenset(['min','max','step_size'])
+_KS_FUNCTION = frozenset(['function'])
+
+# ast nodes allowed in formulas that only use elementwise arithmetic. Other 
+# operators such as @ are not elementwise.
+_ELEMENTWISE_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Name, ast.Constant, ast.Load,
+                      ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+                      ast.UAdd, ast.USub)
+if sys.version_info < (3, 8):
+    # Python 3.7 parses number literals as ast.Num instead of ast.Constant
+    _ELEMENTWISE_NODES += (ast.Num,)
+
+def _is_elementwise(tree, names):
+    # checks if a formula only uses arithmetic on constants and the variables in names
+    for node in ast.walk(tree):
+        if not isinstance(node, _ELEMENTWISE_NODES):
+            return False
+        if isinstance(node, ast.Name) and node.id not in names:
+            return False
+    return True
+
+# formulas are only compiled with numba when they give at least this many values,
+# for smaller arrays compiling takes longer than evaluating them with numpy
+_NUMBA_MIN_SIZE = 1_000_000
+
+# operators that numba evaluates like numpy. Pow, FloorDiv and Mod are left out 
+# since their results for integers differ, e.g. for negative integer powers.
+_NUMBA_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.UAdd, ast.USub)
+
+# formulas and variable names that numba failed to compile
+_numba_failures = set()
+
+@functools.lru_cache(maxsize=None)
+def _make_kernel(formula, names):
+    # makes a numba kernel of an elementwise formula taking the variables in names 
+    # as arguments, None if the formula uses operators numba does not evaluate like numpy
+    for node in ast.walk(ast.parse(formula, mode='eval')):
+        if isinstance(node, (ast.operator, ast.unaryop)) and not isinstance(node, _NUMBA_OPERATORS):
+            return None
+    
+    namespace = {}
+    exec(f"def _kernel({', '.join(names)}):\n    return ({formula})", globals(), namespace)
+    return numba.njit(error_model='numpy')(namespace['_kernel'])
+
+@functools.lru_cache(maxsize=128)
+def _load_yaml_cached(filename, mtime_ns):
+    # parses a yaml file once per (absolute filename, modification time) pair. 
+    # mtime_ns is only part of the cache key so that edited files are parsed again.
+    # the raw bytes are read in one go and decoded by the yaml reader itself
+    with open(filename, 'rb') as file:
+        return yaml.load(file.read(), Loader=CSafeLoader)
+
+def _is_list(value):
+    # lists and arrays with at least one dimension have one entry per row of a ListDict
+    return isinstance(value, list) or (isinstance(value, np.ndarray) and value.ndim > 0)
+
+def _array_equal(a, b):
+    # compares two lists or arrays with numpy instead of element by element
+    try:
+        a_arr, b_arr = np.asarray(a), np.asarray(b)
+    except ValueError:
+        # nested lists of different lengths can not be made into an array
+        return a == b
+    return np.array_equal(a_arr, b_arr)
+
+class _FormulaTransformer(ast.NodeTransformer):
+    # replaces the variables in names with the lookup _vars['name']
+    def __init__(self, names):
+        self.names = names
+
+    def visit_Name(self, node):
+        if node.id not in self.names:
+            return node
+        new_node = ast.parse(f"_vars[{node.id!r}]", mode='eval').body
+        return ast.copy_location(new_node, node)
+
 class BeamlineCongurationUnexpectedKeyError(Exception):
     # Error for handling unexpected nested keys in BeamlineConfiguration.
     # Only nested keys "output" and "input" are expected.
@@ -17,41 +119,103 @@ class BeamlineCongurationUnexpectedKeyError(Exception):
         self.message = f'The key {key} has unexpected nested keys {", ".join(nested_keys)}.'
 
 class ListDict(dict):
-    # each value is a list of equal length or None
+    # each value is a list (or array) of equal length, a scalar or None
     # iterating over the ListDict iterates over the values in the list 
     # returning a dictionary with all the keys
+    __slots__ = ('_list_len',)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # length of the lists in the ListDict, None if there are no lists
+        self._list_len = None
         self._check_lengths()
 
     def __setitem__(self, key, value):
-        if value is not None and not isinstance(value, (list, int, float)):
-            raise TypeError("Value must be None, a scalar or a list")
+        if value is not None and not isinstance(value, (list, int, float, np.ndarray, np.generic)):
+            raise TypeError("Value must be None, a scalar, a list or an array")
         super().__setitem__(key, value)
-        self._check_lengths()
+        if _is_list(value):
+            # only check every value when the length differs from the known one
+            if self._list_len is None:
+                self._list_len = len(value)
+            elif len(value) != self._list_len:
+                self._check_lengths()
 
     def _check_lengths(self):
-        lengths = [len(v) for v in self.values() if isinstance(v, list)]
-        if len(set(lengths)) > 1:
+        lengths = {len(v) for v in self.values() if _is_list(v)}
+        if len(lengths) > 1:
             raise ValueError("All lists must have the same length")
+        self._list_len = next(iter(lengths), None)
 
-    def __iter__(self):
+    def _bulk_update(self, mapping):
+        # adds all items of mapping, checking the list lengths once at the end
+        super().update(mapping)
         self._check_lengths()
-        self._current_index = 0
-        try:
-            self._max_index = len(next(iter(v for v in self.values() if isinstance(v, list))))
-        except StopIteration:
-            if all(isinstance(v, (int, float)) for v in self.values()):
-                self._max_index = 1
-            else:
-                self._max_index = 0
+
+    def __iter__(self):
+        return _ListDictIterator(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        if not any(isinstance(v, np.ndarray) for d in (self, other) for v in d.values()):
+            # without arrays the comparison of dict gives the same result in C
+            return dict.__eq__(self, other)
+        # with arrays == gives an array, so list and array values are compared 
+        # with a single np.array_equal: a list equals an array or list with the 
+        # same shape and elements. identical values are equal, as for dict, so 
+        # that nan equals itself.
+        for key, value in self.items():
+            if key not in other:
+                return False
+            other_value = other[key]
+            if value is other_value:
+                continue
+            if _is_list(value) or _is_list(other_value):
+                if not _array_equal(value, other_value):
+                    return False
+            elif not value == other_value:
+                return False
+        return True
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # rebuild through __init__ so that _list_len is set when copying or pickling
+        return (self.__class__, (dict(self),))
+
+class _ListDictIterator:
+    # iterates over the entries of the lists in a ListDict, returning a plain 
+    # dictionary with all the keys for each entry
+    __slots__ = ('_items', '_list_keys', '_i', '_n')
+
+    def __init__(self, parent):
+        parent._check_lengths()
+        self._items = tuple(parent.items())
+        self._list_keys = frozenset(k for k, v in self._items if _is_list(v))
+        self._i = 0
+        if parent._list_len is not None:
+            self._n = parent._list_len
+        elif all(isinstance(v, (int, float, np.ndarray, np.generic)) for _, v in self._items):
+            self._n = 1
+        else:
+            self._n = 0
+
+    def __iter__(self):
         return self
 
     def __next__(self):
-        if self._current_index >= self._max_index:
+        if self._i >= self._n:
             raise StopIteration
-        result = ListDict({k: (v[self._current_index] if isinstance(v, list) else v) for k, v in self.items()})
-        self._current_index += 1
+        i = self._i
+        result = {k: (v[i] if k in self._list_keys else v) for k, v in self._items}
+        self._i += 1
         return result
         
 class BeamlineConfiguration:
@@ -63,19 +227,42 @@ class BeamlineConfiguration:
         else:
             self.settings = BeamlineConfiguration.load_settings(filename)
         
+        # parsed formulas and the settings variables they use, keyed by formula
+        self._formula_meta = {}
+        
+        # compiled formulas and the settings variables they use, keyed by formula
+        self._formula_cache = {}
+        
+        # information about the settings, see __process_settings
+        self._settings_keys_set = None
+        self.__process_settings()
+        
         # holds the values created from settings 
         self.__input_dict = self.__create_dict()
         
         #contains the values after transforming __input_dict
         self.__output_dict = self.__create_ListDict()
         
+        # values of the variables used in formulas as arrays
+        self._var_arrays = {}
+        
+        # shape of the grid of all combinations of the independent variables,
+        # None if the values are not arranged on a grid
+        self._grid_shape = None
+        
     def gen(self,matched_lengths=False):
         # generate dictionary from settings
         # matched_lengths means all variables have the same number 
         # of values and that we do not want every possible combination in the output dictionary
         
-        # reset calculation ictionaries between generations
-        self = BeamlineConfiguration(settings = self.settings)
+        # settings may have been changed since the last generation
+        self.__process_settings()
+        
+        # reset calculation dictionaries between generations
+        self.__input_dict = self.__create_dict()
+        self.__output_dict = self.__create_ListDict()
+        self._var_arrays = {}
+        self._grid_shape = None
         
         try:
             # check that all settings keys have nested dictionary with keys input or output
@@ -84,13 +271,34 @@ class BeamlineConfiguration:
             self.__process_initial_values()
             if not matched_lengths:
                 self.__populate_initial_values()
-            for key,val in self.settings.items():
-                self.__transform_initial_values(key,val)
+            for key in self.__get_evaluation_order():
+                self.__transform_initial_values(key,self.settings[key])
         except BeamlineCongurationUnexpectedKeyError as e:
             print(e.message)
         
+        # arrays are only converted to lists for the returned dictionary
+        self.__output_dict._bulk_update({
+            key: val.tolist() for key,val in self.__output_dict.items() 
+            if isinstance(val, (np.ndarray, np.generic))
+        })
+        
         return self.__output_dict      
 
+    def __process_settings(self):
+        # finds the information about the settings that is used throughout gen. 
+        # As settings can be changed between calls of gen, this is done for every call.
+        settings_keys_set = frozenset(self.settings.keys())
+        if settings_keys_set != self._settings_keys_set:
+            # the variables found in formulas depend on the keys of settings
+            self._formula_meta = {}
+            self._formula_cache = {}
+        
+        self._keys_tuple = tuple(self.settings.keys())
+        self._settings_keys_set = settings_keys_set
+        self._ind_vars = tuple(key for key,val in self.settings.items() if 'input' in val)
+        self._input_key_sets = {key: frozenset(val.get('input',{}).keys()) for key,val in self.settings.items()}
+        self._output_key_sets = {key: frozenset(val.get('output',{}).keys()) for key,val in self.settings.items()}
+
     @staticmethod
     def split(d):
         # splits __output_dict into dictionary based off of prefixes of the 
@@ -119,10 +327,12 @@ class BeamlineConfiguration:
     
     @staticmethod
     def load_settings(filename):
-        with open(filename, 'r') as file:
-            settings = yaml.safe_load(file)
+        # copy the cached settings so that callers modifying them do not
+        # change the result of later calls
+        filename = os.path.abspath(filename)
+        settings = _load_yaml_cached(filename, os.stat(filename).st_mtime_ns)
     
-        return settings
+        return copy.deepcopy(settings)
     
     def __check_nested_keys(self):
         # check that all settings keys have nested dictionary with keys input or output
@@ -132,12 +342,12 @@ class BeamlineConfiguration:
                 raise BeamlineCongurationUnexpectedKeyError(key,val.keys())
             
             # check that input and output keys have the expected nested keys    
-            input_keys = frozenset(val.get('input',{}).keys())
+            input_keys = self._input_key_sets[key]
             input_bad_keys = input_keys.difference({'value','min','max','number_steps','step_size'})
             if input_bad_keys:
                 raise BeamlineCongurationUnexpectedKeyError(key,input_bad_keys)
                 
-            output_keys = frozenset(val.get('output',{}).keys())
+            output_keys = self._output_key_sets[key]
             output_bad_keys = output_keys.difference({'function'})
             if output_bad_keys:
                 raise BeamlineCongurationUnexpectedKeyError(key,output_bad_keys)
@@ -146,92 +356,198 @@ class BeamlineConfiguration:
         # for processing 'input' key from settings
         # generates values for input_dict from self.settings
         
-        # all options for generating values
-        switcher = {
-        frozenset([]): lambda x: None,
-        frozenset(['value']): lambda x: x['value'],
-        frozenset(['min','max','number_steps']): lambda x: np.linspace(x['min'],x['max'],x['number_steps']).tolist(),
-        frozenset(['min','max','step_size']): lambda x: np.arange(x['min'],x['max']+x['step_size']/2,x['step_size']).tolist(),
-        }
-        
         for key,val in self.settings.items():
-            input_keys = frozenset(val.get('input',{}).keys())
-            self.__input_dict[key] = switcher[input_keys](val.get('input',None))
+            input_keys = self._input_key_sets[key]
+            x = val.get('input',None)
+            
+            # all options for generating values
+            if input_keys == _KS_VALUE:
+                value = x['value']
+            elif input_keys == _KS_LINSPACE:
+                value = np.linspace(x['min'],x['max'],x['number_steps'])
+            elif input_keys == _KS_ARANGE:
+                value = self.__step_values(x['min'],x['max'],x['step_size'])
+            elif input_keys == _KS_EMPTY:
+                value = None
+            else:
+                raise KeyError(input_keys)
+            self.__input_dict[key] = value
+            
+    @staticmethod
+    def __step_values(start,stop,step_size):
+        # values from start to stop in steps of step_size, including stop if it 
+        # is a whole number of steps from start
+        number_steps = (stop-start)/step_size
+        if number_steps >= 0 and math.isclose(number_steps, round(number_steps), rel_tol=1e-9, abs_tol=1e-9):
+            # np.linspace hits stop exactly instead of accumulating the step
+            return np.linspace(start,stop,int(round(number_steps))+1)
+        return np.arange(start,stop+step_size/2,step_size)
             
     def __populate_initial_values(self):
         # get values for all independent variables and make every possible combination of variables
         ind_vars = self.__get_independent_var()
-        temp_vars = [np.array(self.__input_dict[ind_var]) for ind_var in ind_vars]
-        temp_arr = self.__makeInputs(*temp_vars)
-
-        # redistribute new values with all combination to their original dict entries
-        # if values for inputs are not scalars, determine how to make all outputs have the same output length
-        for ind_var,arr in zip(ind_vars,temp_arr.T):
-            temp = arr.tolist()
-            if len(temp) == 1:
-                temp = temp[0]
-            self.__input_dict[ind_var] = temp
+        temp_vars = [np.asarray(self.__input_dict[ind_var]) for ind_var in ind_vars]
+        
+        # if every variable has a single value, that is the only combination
+        if all(temp.size == 1 for temp in temp_vars):
+            self.__input_dict.update(
+                (ind_var, temp.reshape(-1)[0]) for ind_var,temp in zip(ind_vars,temp_vars)
+            )
+            return
+        
+        # instead of making every combination, each variable is reshaped to lie
+        # along its own axis of the grid of combinations. Elementwise formulas 
+        # then only broadcast over the axes of the variables they use, and 
+        # __expand_grid gives the values for every combination when needed.
+        temp_vars = [np.ravel(temp) for temp in temp_vars]
+        self._grid_shape = tuple(temp.size for temp in temp_vars)
+        
+        new_values = {}
+        for i,(ind_var,temp) in enumerate(zip(ind_vars,temp_vars)):
+            shape = [1]*len(temp_vars)
+            shape[i] = temp.size
+            new_values[ind_var] = temp.reshape(shape)
+        self.__input_dict.update(new_values)
             
     def __transform_initial_values(self,key,val):
         # transforms the initial values in the input_dict using the 'output' key of settings
+        if self.__output_dict[key] is not None:
+            return
         
-        switcher = {
-        frozenset([]): lambda x: x,
-        frozenset(['function']): lambda x: self.__eval_function(x['function'])
-        }
+        output_keys = self._output_key_sets[key]
         
-        input_keys = frozenset(val.get('output',{}).keys())
+        if output_keys == _KS_FUNCTION:
+            value = self.__eval_function(key,val['output']['function'])
+        elif output_keys == _KS_EMPTY:
+            value = self.__input_dict.get(key)
+        else:
+            raise KeyError(output_keys)
         
-        switcher_input = self.__input_dict.get(key) if self.settings.get(key).get('output') is None else self.settings.get(key).get('output')
+        self.__output_dict[key] = self.__expand_grid(value)
+    
+    def __expand_grid(self,value):
+        # gives a value on the grid of combinations of the independent variables 
+        # one entry per combination, other values are returned unchanged
+        if self._grid_shape is None or np.ndim(value) != len(self._grid_shape):
+            return value
+        return np.broadcast_to(value, self._grid_shape).reshape(-1)
         
-        self.__output_dict[key] = switcher[input_keys](switcher_input)
+    def __get_formula_meta(self,formula):
+        # parses the formula once and finds the variables from settings it uses
+        if formula not in self._formula_meta:
+            tree = ast.parse(formula, mode='eval')
+            
+            # filter out only candidates that appear in settings
+            names = tuple(dict.fromkeys(
+                node.id for node in ast.walk(tree) 
+                if isinstance(node, ast.Name) and node.id in self._settings_keys_set
+            ))
+            
+            self._formula_meta[formula] = (tree, names, _is_elementwise(tree, names))
         
+        return self._formula_meta[formula]
+    
     def __process_function_string(self,formula):
-        # Creates new string that can be evaluated by python
-        node_list = [
-            node for node in ast.walk(ast.parse(formula)) 
-            if isinstance(node, ast.Name)
-        ]
-        
-        # possible name of the variables in the formula
-        names = [node.id for node in node_list]
-        
-        # filter out only candidates that appear in settings
-        names = [x for x in names if x in self.settings.keys()]
-        
-        # function must depend on variables defined in settings, otherwise names is empty
-        assert names != None
+        # Compiles the formula once, replacing each variable from settings with
+        # a lookup into the dictionary _vars that is passed to eval
+        if formula not in self._formula_cache:
+            tree, names, elementwise = self.__get_formula_meta(formula)
             
-        #all variables need to be independent
-        # assert all([self.__check_variable_independent(x) for x in names])
+            # the transformer modifies the tree, so work on a copy of the cached one
+            tree = _FormulaTransformer(names).visit(copy.deepcopy(tree))
+            tree = ast.fix_missing_locations(tree)
+            self._formula_cache[formula] = (compile(tree, '<formula>', 'eval'), names, elementwise)
+        
+        return self._formula_cache[formula]
+    
+    def __eval_function(self,key,formula):
+        # uses eval, which can be unsafe as users can inject malicious code
+        code, names, elementwise = self.__process_function_string(formula)
+        full_inputs = self._grid_shape is not None and not elementwise
         
-        # find the pairs of successive breakpoints in the formula based off of the variables
-        temp = sorted(list(set(sorted([0]+[node.col_offset for node in node_list]+[node.end_col_offset for node in node_list]+[len(formula)]))))
+        _vars = {name: self.__get_var_array(name) for name in names}
+        if full_inputs:
+            # formulas that may not act on each entry separately, e.g. np.sum, 
+            # get one entry per combination of the independent variables
+            _vars = {name: self.__expand_grid(value) for name,value in _vars.items()}
         
-        pairs = [(first, second) for first, second in zip(temp, temp[1:])]
+        result = None
+        if self.__use_numba(formula,names,elementwise,_vars):
+            kernel = _make_kernel(formula,names)
+            if kernel is not None:
+                try:
+                    result = kernel(*_vars.values())
+                except numba.core.errors.NumbaError:
+                    # numba could not compile the formula for these values
+                    _numba_failures.add((formula,names))
+        if result is None:
+            # _vars is passed as a global so comprehensions and lambdas can see it
+            result = eval(code, {**_EVAL_GLOBALS, '_vars': _vars})
         
-        new_form = ''
+        result = np.asarray(result)
+        if full_inputs and result.ndim == 1 and result.size == np.prod(self._grid_shape):
+            # arrange the result on the grid again for use in other formulas
+            result = result.reshape(self._grid_shape)
         
-        for pair0,pair1 in pairs:
-            if formula[pair0:pair1] in names:
-                #if pair of breakpoints is for a variable, return the variable value
-                # if input did not exist in settings, use the calculated value from output                
-                if self.__input_dict[formula[pair0:pair1]] is not None:
-                    value = self.__input_dict[formula[pair0:pair1]]
-                else:
-                    self.__transform_initial_values(formula[pair0:pair1],self.settings[formula[pair0:pair1]])
-                    value = self.__output_dict[formula[pair0:pair1]]
-                    
-                new_form += f"np.array({value})"
+        # formulas using key refer to its input value if there is one, 
+        # otherwise they use this result
+        if self.__input_dict[key] is None:
+            self._var_arrays[key] = result
+        return result
+    
+    @staticmethod
+    def __use_numba(formula,names,elementwise,_vars):
+        # numba is only worth it for elementwise formulas giving large arrays
+        if numba is None or not names or not elementwise or (formula,names) in _numba_failures:
+            return False
+        # numba gives numbers for boolean arithmetic that numpy refuses, e.g. 
+        # a - b, and can not compile object arrays, so those are left to numpy
+        if not all(np.issubdtype(value.dtype, np.number) for value in _vars.values()):
+            return False
+        shape = np.broadcast_shapes(*(np.shape(value) for value in _vars.values()))
+        return np.prod(shape) >= _NUMBA_MIN_SIZE
+    
+    def __get_var_array(self,name):
+        # returns the value of a variable as an array, converting it only once
+        if name not in self._var_arrays:
+            # if input did not exist in settings, use the calculated value from 
+            # output, which __get_evaluation_order ensures is already calculated
+            if self.__input_dict[name] is not None:
+                self._var_arrays[name] = np.asarray(self.__input_dict[name])
             else:
-                new_form += formula[pair0:pair1]
+                self._var_arrays[name] = np.asarray(self.__output_dict[name])
         
-        return new_form
+        return self._var_arrays[name]
     
-    def __eval_function(self,formula):
-        # uses eval, which can be unsafe as users can inject malicious code
-        new_function_str = self.__process_function_string(formula) 
-        return eval(new_function_str).tolist()
+    def __get_evaluation_order(self):
+        # orders the settings keys so that each variable is transformed after 
+        # the variables without an input value that its formula uses
+        dependents = {key: [] for key in self._keys_tuple}
+        num_deps = dict.fromkeys(self._keys_tuple, 0)
+        for key in self._keys_tuple:
+            if self._output_key_sets[key] != _KS_FUNCTION:
+                continue
+            _, names, _ = self.__get_formula_meta(self.settings[key]['output']['function'])
+            for name in names:
+                if self.__input_dict[name] is None:
+                    dependents[name].append(key)
+                    num_deps[key] += 1
+        
+        ready = collections.deque(key for key in self._keys_tuple if num_deps[key] == 0)
+        order = []
+        while ready:
+            key = ready.popleft()
+            order.append(key)
+            for dependent in dependents[key]:
+                num_deps[dependent] -= 1
+                if num_deps[dependent] == 0:
+                    ready.append(dependent)
+        
+        if len(order) != len(self._keys_tuple):
+            cycle = [key for key in self._keys_tuple if num_deps[key] > 0]
+            raise ValueError(f'The formulas of {", ".join(cycle)} depend on each other.')
+        
+        return order
     
     def __check_variable_independent(self,var):
         ind_vars = self.__get_independent_var()
@@ -239,42 +555,24 @@ class BeamlineConfiguration:
     
     def __get_independent_var(self):
         # gets variables that calculated using their own input value
-        return [key for key in self.settings.keys() if 'input' in self.settings[key]]
+        return self._ind_vars
     
-    def __makeInputs(self,*args):
-        # given lists of inputs, outputs 2d array with each combination of the lists
-        
-        # ensure each argument is a list or array
-        args = [np.array(arg).reshape(-1) for arg in args]
-        
-        combinations = list(itertools.product(*args))
-        return np.array(combinations)
-
     def __create_dict(self):
         # makes an empty dictionary with values None with the keys from settings. 
-        key_list = self.settings.keys()
-        d = {}
-        d.__init__(zip(key_list, [None]*len(key_list)))
-        return d
+        return dict.fromkeys(self._keys_tuple)
     
     def __create_ListDict(self):
         # makes an empty dictionary with values None with the keys from settings. 
-        key_list = self.settings.keys()
-        d = ListDict({})
-        d.__init__(zip(key_list, [None]*len(key_list)))
+        d = ListDict()
+        d._bulk_update(dict.fromkeys(self._keys_tuple))
         return d
     
 def main():
     # run test cases
     for i in np.arange(1,9):
         print(i)
-        with open(f'input_{i}.yaml', 'r') as file:
-            input_dict = ListDict(yaml.safe_load(file))
-            # input_dict = yaml.safe_load(file)
-
-        with open(f'output_{i}.yaml', 'r') as file:
-            output_dict_test = ListDict(yaml.safe_load(file))
-            # output_dict_test = yaml.safe_load(file)
+        input_dict = ListDict(BeamlineConfiguration.load_settings(f'input_{i}.yaml'))
+        output_dict_test = ListDict(BeamlineConfiguration.load_settings(f'output_{i}.yaml'))
 
         a=BeamlineConfiguration(input_dict)
 
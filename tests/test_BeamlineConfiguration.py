@@ -1,20 +1,149 @@
+import math
 import os
+import tempfile
 import yaml
 from parameterized import parameterized
 import unittest
+from unittest import mock
 
+import beamline_configuration.beamline_configuration as beamline_configuration_module
 from beamline_configuration import BeamlineConfiguration
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+__location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
+
 class TestBeamlineConfiguration(unittest.TestCase):
-    @parameterized.expand(list(range(1,10)))
+    @parameterized.expand(list(range(1,19)))
     def test_gen(self, case_number):
         with open(os.path.join(__location__,f'case_{case_number}.yaml'), 'r') as file:
             input_dict,output_dict_test = (x for x in yaml.safe_load_all(file))
             
-        beamline_config = BeamlineConfiguration(input_dict)
+        beamline_config = BeamlineConfiguration(settings=input_dict)
         output_dict = beamline_config.gen()
         
         self.assertDictEqual(output_dict_test, output_dict)
+
+    def test_load_settings(self):
+        with tempfile.TemporaryDirectory() as dir_1, tempfile.TemporaryDirectory() as dir_2:
+            for dir_name, value in ((dir_1, 1), (dir_2, 2)):
+                filename = os.path.join(dir_name, 'settings.yaml')
+                with open(filename, 'w') as file:
+                    file.write(f'a:\n  input:\n    value: {value}\n')
+                os.utime(filename, ns=(0, 0))
+
+            cwd = os.getcwd()
+            try:
+                os.chdir(dir_1)
+                settings = BeamlineConfiguration.load_settings('settings.yaml')
+                self.assertEqual({'a': {'input': {'value': 1}}}, settings)
+
+                # changing the result does not change later results
+                settings['b'] = {}
+                self.assertEqual({'a': {'input': {'value': 1}}}, BeamlineConfiguration.load_settings('settings.yaml'))
+
+                # same relative name and modification time, but a different file
+                os.chdir(dir_2)
+                self.assertEqual({'a': {'input': {'value': 2}}}, BeamlineConfiguration.load_settings('settings.yaml'))
+
+                # edited file
+                with open('settings.yaml', 'w') as file:
+                    file.write('a:\n  input:\n    value: 3\n')
+                os.utime('settings.yaml', ns=(1, 1))
+                self.assertEqual({'a': {'input': {'value': 3}}}, BeamlineConfiguration.load_settings('settings.yaml'))
+            finally:
+                os.chdir(cwd)
+
+    def test_gen_circular_formulas(self):
+        settings = {
+            'a': {'output': {'function': 'b+1'}},
+            'b': {'output': {'function': 'a*2'}},
+        }
+        with self.assertRaises(ValueError):
+            BeamlineConfiguration(settings=settings).gen()
+
+    def test_gen_keeps_input_types(self):
+        settings = {
+            'a': {'input': {'value': [True, False]}},
+            'b': {'input': {'value': [1.5, 2.5]}},
+            'c': {'input': {'value': 2}},
+        }
+        output_dict = BeamlineConfiguration(settings=settings).gen()
+
+        self.assertEqual([True, True, False, False], output_dict['a'])
+        self.assertTrue(all(type(x) is bool for x in output_dict['a']))
+        self.assertTrue(all(type(x) is int for x in output_dict['c']))
+
+    def test_gen_after_changing_settings(self):
+        beamline_config = BeamlineConfiguration(settings={'a': {'input': {'value': 1}}})
+        beamline_config.gen()
+
+        beamline_config.settings['b'] = {'input': {'value': 2}}
+        beamline_config.settings['c'] = {'output': {'function': 'a+b'}}
+        self.assertDictEqual({'a': 1, 'b': 2, 'c': 3}, beamline_config.gen())
+
+        beamline_config.settings['b'] = {'input': {'value': [2, 3]}}
+        self.assertDictEqual({'a': [1, 1], 'b': [2, 3], 'c': [3, 4]}, beamline_config.gen())
+
+    def test_gen_returns_new_dict(self):
+        beamline_config = BeamlineConfiguration(settings={'a': {'input': {'value': [1, 2]}}})
+        first = beamline_config.gen()
+        second = beamline_config.gen()
+
+        self.assertIsNot(first, second)
+        self.assertDictEqual(first, second)
+
+    def test_gen_formula_namespace(self):
+        settings = {
+            'a': {'input': {'value': [1, 4]}},
+            'b': {'output': {'function': 'np.sqrt(a) + math.pi'}},
+        }
+        self.assertDictEqual({'a': [1, 4], 'b': [1 + math.pi, 2 + math.pi]},
+                             BeamlineConfiguration(settings=settings).gen())
+
+        # module internals are not visible to formulas
+        settings['b'] = {'output': {'function': 'ListDict(a=a)'}}
+        with self.assertRaises(NameError):
+            BeamlineConfiguration(settings=settings).gen()
+
+    @unittest.skipIf(numba is None, 'numba is not installed')
+    def test_gen_numba(self):
+        settings_list = [
+            # int and float inputs on a (2,1) and (1,3) grid
+            {
+                'a': {'input': {'value': [1, 2]}},
+                'b': {'input': {'min': 0.5, 'max': 1.5, 'number_steps': 3}},
+                'c': {'output': {'function': 'a*b'}},
+                'd': {'output': {'function': '2*a-1'}},
+                'e': {'output': {'function': 'c/a+b'}},
+            },
+            # bool inputs
+            {
+                'a': {'input': {'value': [True, False]}},
+                'b': {'output': {'function': 'a+a'}},
+            },
+            # object inputs
+            {
+                'a': {'input': {'value': [2**70, 1]}},
+                'b': {'output': {'function': 'a+1'}},
+            },
+        ]
+        uses_kernel = [True, False, False]
+
+        module = beamline_configuration_module
+        for settings, kernel_used in zip(settings_list, uses_kernel):
+            expected = BeamlineConfiguration(settings=settings).gen()
+            with mock.patch.object(module, '_NUMBA_MIN_SIZE', 1), \
+                 mock.patch.object(module, '_numba_failures', set()), \
+                 mock.patch.object(module, '_make_kernel', wraps=module._make_kernel) as make_kernel:
+                output_dict = BeamlineConfiguration(settings=settings).gen()
+                self.assertFalse(module._numba_failures)
+
+            self.assertDictEqual(expected, output_dict)
+            self.assertEqual(kernel_used, make_kernel.called)
         
 
 if __name__ == '__main__':
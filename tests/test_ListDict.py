@@ -0,0 +1,73 @@
+import copy
+import pickle
+import unittest
+
+import numpy as np
+
+from beamline_configuration import ListDict
+
+class TestListDict(unittest.TestCase):
+    def test_unequal_lengths(self):
+        with self.assertRaises(ValueError):
+            ListDict(a=[1, 2], b=[1, 2, 3])
+
+        d = ListDict(a=[1, 2])
+        with self.assertRaises(ValueError):
+            d['b'] = [1, 2, 3]
+
+    def test_replace_only_list(self):
+        d = ListDict(a=[1, 2], b=3)
+        d['a'] = [1, 2, 3]
+        d['c'] = [4, 5, 6]
+        self.assertEqual(3, d._list_len)
+
+    def test_array_values(self):
+        d = ListDict(a=np.array([1, 2]))
+        d['b'] = np.float64(3.0)
+        with self.assertRaises(ValueError):
+            d['c'] = np.array([1, 2, 3])
+        with self.assertRaises(TypeError):
+            d['d'] = 'text'
+
+    def test_iteration(self):
+        d = ListDict(a=[1, 2], b=3)
+        rows = list(d)
+
+        self.assertEqual([{'a': 1, 'b': 3}, {'a': 2, 'b': 3}], rows)
+        self.assertTrue(all(type(row) is dict for row in rows))
+        self.assertEqual([{'a': 1, 'b': 2.0}], list(ListDict(a=1, b=2.0)))
+        self.assertEqual([], list(ListDict(a=None)))
+
+    def test_copy_and_pickle(self):
+        d = ListDict(a=[1, 2], b=3)
+        for new_d in (pickle.loads(pickle.dumps(d)), copy.deepcopy(d), copy.copy(d)):
+            self.assertEqual(d, new_d)
+            self.assertIsInstance(new_d, ListDict)
+            self.assertEqual(2, new_d._list_len)
+
+    def test_equality(self):
+        d = ListDict(a=[1, 2], b=3)
+
+        self.assertEqual(d, {'a': [1, 2], 'b': 3})
+        self.assertEqual({'a': [1, 2], 'b': 3}, d)
+        self.assertNotEqual(d, {'a': [1, 3], 'b': 3})
+        self.assertNotEqual(d, {'a': [1, 2], 'c': 3})
+        self.assertNotEqual(d, {'a': [1, 2]})
+        self.assertEqual(d, ListDict(a=np.array([1.0, 2.0]), b=3))
+        self.assertNotEqual(d, ListDict(a=np.array([1.0, 3.0]), b=3))
+        self.assertEqual(ListDict(a=[[1], [2, 3]]), ListDict(a=[[1], [2, 3]]))
+        self.assertEqual(ListDict(a=np.array([1, 2])), {'a': np.array([1, 2])})
+        self.assertNotEqual(ListDict(a=np.array([1, 2])), {'a': np.array([1, 2, 3])})
+        self.assertNotEqual(ListDict(a=[1, 2]), {'a': np.array([1, 2, 3])})
+        self.assertEqual(ListDict(a=[[1, 2], [3, 4]], b=np.array([5, 6])),
+                         {'a': np.array([[1, 2], [3, 4]]), 'b': [5, 6]})
+        self.assertNotEqual(ListDict(a=[[1, 2], [3, 4]], b=np.array([5, 6])),
+                            {'a': [[1, 2], [3, 5]], 'b': np.array([5, 6])})
+
+        d = ListDict(a=float('nan'))
+        self.assertTrue(d == d)
+        d = ListDict(a=np.array([float('nan')]), b=float('nan'))
+        self.assertTrue(d == d)
+
+if __name__ == '__main__':
+    unittest.main()